@@ -1,97 +1,454 @@
 import time
+from collections import deque
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
+from numba import njit
 
 
-def generate_tap_states(attacker, defender, turn, k):
-    """Generates possible states resulting from attacker taps defender with one of his hands"""
-    next_states = []
-    for i in range(2):
-        for j in range(2):
-            if attacker[i] == 0 or defender[j] == 0:
-                continue
+@njit(cache=True)
+def pack(l1, l2, r1, r2, turn, k):
+    """Packs a game state into a single int. The four hands are base-k digits and the turn is the
+    lowest bit, so every state of the game maps to a unique id in range(2 * k**4).
+    """
+    return ((((l1 * k + l2) * k + r1) * k + r2) << 1) | turn
 
-            new_value = attacker[i] + defender[j]
-            if new_value >= k:
-                new_value = 0
 
-            new_defender = defender.copy()
-            new_defender[j] = new_value
+@njit(cache=True)
+def unpack(s, k):
+    """Inverse of pack, returns the 5-tuple (l1, l2, r1, r2, turn)"""
+    turn = s & 1
+    s >>= 1
+    r2 = s % k
+    s //= k
+    r1 = s % k
+    s //= k
+    return s // k, s % k, r1, r2, turn
 
-            if turn == 0:
-                next_states.append(tuple(attacker[:] + new_defender[:] + [1]))
-            else:
-                next_states.append(tuple(new_defender[:] + attacker[:] + [0]))
-    return list(set(next_states))
+
+@njit(cache=True)
+def hand_code(h0, h1, k):
+    """Codes a sorted pair of hands as the two base-k digits min(h0, h1), max(h0, h1)"""
+    return min(h0, h1) * k + max(h0, h1)
+
+
+@njit(cache=True)
+def canon(l1, l2, r1, r2, turn, k):
+    """Packs the canonical form of a state. Swapping a player's two hands does not change the game,
+    so each pair of hands is sorted before packing and all equivalent states share one id.
+    """
+    return ((hand_code(l1, l2, k) * k * k + hand_code(r1, r2, k)) << 1) | turn
 
 
-def generate_split_states(attacker, defender, turn, k):
-    """Generates the possible states resulting from attacker splitting his fingers"""
-    next_states = []
-    total_fingers = attacker[0] + attacker[1]
-    for left_fingers in range(0, total_fingers + 1):
+@njit(cache=True)
+def generate_tap_states(a0, a1, d0, d1, turn, k, out, n):
+    """Writes the states resulting from attacker (a0, a1) tapping defender (d0, d1) with one of his
+    hands into out, starting at out[n]. Returns the new number of states in out.
+    """
+    # New value of the tapped hand for every (attacking, defending) pair, wrapping to 0 at k
+    s00, s01, s10, s11 = a0 + d0, a0 + d1, a1 + d0, a1 + d1
+    v00, v01, v10, v11 = s00 * (s00 < k), s01 * (s01 < k), s10 * (s10 < k), s11 * (s11 < k)
+
+    # A tap needs both hands to be alive
+    ok00 = (a0 != 0) & (d0 != 0)
+    ok01 = (a0 != 0) & (d1 != 0)
+    ok10 = (a1 != 0) & (d0 != 0)
+    ok11 = (a1 != 0) & (d1 != 0)
+
+    # The attacker's hands are the same in every successor, so their part of the packed state is
+    # computed once. Player 1 moves to (attacker, defender, 1), player 2 to (defender, attacker, 0).
+    k2 = k * k
+    if turn == 0:
+        base, scale, next_turn = hand_code(a0, a1, k) * k2, 1, 1
+    else:
+        base, scale, next_turn = hand_code(a0, a1, k), k2, 0
+
+    # Always write the candidate and only advance past it when it is valid
+    out[n] = ((base + hand_code(v00, d1, k) * scale) << 1) | next_turn
+    n += ok00
+    out[n] = ((base + hand_code(d0, v01, k) * scale) << 1) | next_turn
+    n += ok01
+    out[n] = ((base + hand_code(v10, d1, k) * scale) << 1) | next_turn
+    n += ok10
+    out[n] = ((base + hand_code(d0, v11, k) * scale) << 1) | next_turn
+    n += ok11
+    return n
+
+
+@njit(cache=True)
+def generate_split_states(a0, a1, d0, d1, turn, k, out, n):
+    """Writes the states resulting from attacker (a0, a1) splitting his fingers into out, starting
+    at out[n]. Returns the new number of states in out.
+    """
+    # The defender's hands are the same in every successor, see generate_tap_states
+    k2 = k * k
+    if turn == 0:
+        base, scale, next_turn = hand_code(d0, d1, k), k2, 1
+    else:
+        base, scale, next_turn = hand_code(d0, d1, k) * k2, 1, 0
+
+    # Only splits with left_fingers <= right_fingers, the others are the same canonical state
+    total_fingers = a0 + a1
+    attacker_min = min(a0, a1)
+    for left_fingers in range(0, total_fingers // 2 + 1):
         right_fingers = total_fingers - left_fingers
 
         # Mkae sure that left and right stay legal
         if left_fingers >= k or right_fingers >= k:
             continue
 
-        # Make sure the new states are not identical.
-        if list(sorted([left_fingers, right_fingers])) == list(sorted(attacker)):
+        # Make sure the new states are not identical. Both pairs are sorted and have the same total,
+        # so comparing the smaller hand is enough.
+        if left_fingers == attacker_min:
             continue
 
         # Otherwise, we can append the state
-        if turn == 0:
-            next_states.append(tuple([left_fingers, right_fingers] + defender + [1]))
-        else:
-            next_states.append(tuple(defender + [left_fingers, right_fingers] + [0]))
-    return list(set(next_states))
+        out[n] = ((base + (left_fingers * k + right_fingers) * scale) << 1) | next_turn
+        n += 1
+    return n
 
 
-def generate_graph(k=5):
-    """Graph for chopsticks. Nodes are the game states, a 5-tuple of (l1, l2, r1, r2, player). Edges
-    represent the actions that can be taken in order to move from one state to the next.
+@njit(cache=True)
+def generate_successors(l1, l2, r1, r2, turn, k, out):
+    """Writes the distinct successors of a non-terminal state into out, which must hold at least
+    4 + 2 * k entries. Returns the number of successors written.
     """
-    initial_state = (1, 1, 1, 1, 0)
-    graph = {}
-    stack = [initial_state]
-    while stack:
-        state = stack.pop()
-        p1_left, p1_right, p2_left, p2_right, turn = state
-
-        # This is a terminal node, no further processing
-        if p1_left == 0 and p1_right == 0:
-            continue
-        elif p2_left == 0 and p2_right == 0:
-            continue
+    # Attacker and defender depends on turn
+    if turn == 0:
+        n = generate_tap_states(l1, l2, r1, r2, turn, k, out, 0)
+    else:
+        n = generate_tap_states(r1, r2, l1, l2, turn, k, out, 0)
+
+    # Taps with equal hands give the same state twice, sort and drop the duplicates. Splits are
+    # distinct from each other and from every tap, since only splits change the attacker's hands.
+    out[:n].sort()
+    m = 0
+    for i in range(n):
+        if m == 0 or out[i] != out[m - 1]:
+            out[m] = out[i]
+            m += 1
+
+    if turn == 0:
+        return generate_split_states(l1, l2, r1, r2, turn, k, out, m)
+    return generate_split_states(r1, r2, l1, l2, turn, k, out, m)
+
+
+@njit(cache=True)
+def build_successor_table(k):
+    """Precomputes the successors for every (attacker, defender) pair of hands in CSR form. A pair of
+    hands (h0, h1) is coded as h0 * k + h1 and the table is keyed by attacker * k**2 + defender. The
+    successors are stored with the same coding from the point of view of the attacker, with no
+    turn bit, and terminal keys have no successors.
+    """
+    n_keys = k**4
+    out = np.empty(4 + 2 * k, dtype=np.int64)
+    tab_indptr = np.zeros(n_keys + 1, dtype=np.int32)
+    tab_indices = np.empty(n_keys * (4 + 2 * k), dtype=np.int32)
+    for key in range(n_keys):
+        a0, a1, d0, d1, _ = unpack(key << 1, k)
+        n = 0
+        if (a0 != 0 or a1 != 0) and (d0 != 0 or d1 != 0):
+            n = generate_successors(a0, a1, d0, d1, 0, k, out)
+        start = tab_indptr[key]
+        for i in range(n):
+            tab_indices[start + i] = out[i] >> 1
+        tab_indptr[key + 1] = start + n
+    return tab_indptr, tab_indices[: tab_indptr[n_keys]].copy()
+
+
+@njit(cache=True)
+def swap_players(code, k):
+    """Swaps the two pairs of hands in a table key or successor code"""
+    k2 = k * k
+    return (code % k2) * k2 + code // k2
+
+
+@njit(cache=True)
+def successor_range(state, k, tab_indptr):
+    """Returns the range of the successors of a state in the successor table."""
+    key = state >> 1
+    if state & 1:
+        key = swap_players(key, k)
+    return tab_indptr[key], tab_indptr[key + 1]
+
+
+@njit(cache=True)
+def successor_state(code, turn, k):
+    """Turns a successor from the successor table back into a packed state after a move by turn."""
+    if turn == 0:
+        return (code << 1) | 1
+    return swap_players(code, k) << 1
+
+
+@njit(cache=True)
+def build_graph(k):
+    """Enumerates every state reachable from the initial state and builds the graph in CSR form. The
+    children of state s are indices[indptr[s]:indptr[s + 1]], and states lists the reachable states
+    in the order they were discovered. Terminal states have no children.
+    """
+    n_states = 2 * k**4
+    initial_state = canon(1, 1, 1, 1, 0, k)
+    tab_indptr, tab_indices = build_successor_table(k)
+
+    # First pass, closed-list DFS counting the children of every state
+    indptr = np.zeros(n_states + 1, dtype=np.int32)
+    visited = np.zeros(n_states, dtype=np.uint8)
+    stack = np.empty(n_states, dtype=np.int32)
+    states = np.empty(n_states, dtype=np.int32)
+    num_states = 0
+    top = 0
+    stack[top] = initial_state
+    top += 1
+    visited[initial_state] = 1
+    while top > 0:
+        top -= 1
+        state = stack[top]
+        states[num_states] = state
+        num_states += 1
+        turn = state & 1
+
+        lo, hi = successor_range(state, k, tab_indptr)
+        indptr[state + 1] = hi - lo
+        for i in range(lo, hi):
+            next_state = successor_state(tab_indices[i], turn, k)
+            if not visited[next_state]:
+                visited[next_state] = 1
+                stack[top] = next_state
+                top += 1
+
+    # Second pass, fill in the children now that the offsets are known
+    for s in range(n_states):
+        indptr[s + 1] += indptr[s]
+    indices = np.empty(indptr[n_states], dtype=np.int32)
+    for i in range(num_states):
+        state = states[i]
+        turn = state & 1
+        lo, hi = successor_range(state, k, tab_indptr)
+        for j in range(lo, hi):
+            indices[indptr[state] + j - lo] = successor_state(tab_indices[j], turn, k)
+    return indptr, indices, states[:num_states].copy()
 
-        # Attacker and defender depends on turn
-        if turn == 0:
-            attacker = [p1_left, p1_right]
-            defender = [p2_left, p2_right]
-        else:
-            attacker = [p2_left, p2_right]
-            defender = [p1_left, p1_right]
 
-        next_states = []
-        next_states += generate_tap_states(attacker, defender, turn, k)
-        next_states += generate_split_states(attacker, defender, turn, k)
+def generate_graph(k=5):
+    """Graph for chopsticks. Nodes are the game states, a 5-tuple of (l1, l2, r1, r2, player) packed
+    into a single int with canon. Edges represent the actions that can be taken in order to move
+    from one state to the next.
+    """
+    indptr, indices, states = build_graph(k)
+    return {
+        state: indices[indptr[state] : indptr[state + 1]].tolist()
+        for state in states.tolist()
+    }
+
+
+@njit(cache=True)
+def reverse_graph(indptr, indices):
+    """Builds the parents of every state in CSR form from the children CSR with a counting sort."""
+    n_states = len(indptr) - 1
+    rev_indptr = np.zeros(n_states + 1, dtype=np.int32)
+    for child in indices:
+        rev_indptr[child + 1] += 1
+    for s in range(n_states):
+        rev_indptr[s + 1] += rev_indptr[s]
+
+    # Scatter every edge into the next free slot of its child
+    fill = rev_indptr[:-1].copy()
+    rev_indices = np.empty(len(indices), dtype=np.int32)
+    for state in range(n_states):
+        for i in range(indptr[state], indptr[state + 1]):
+            child = indices[i]
+            rev_indices[fill[child]] = state
+            fill[child] += 1
+    return rev_indptr, rev_indices
+
+
+# Outcomes are stored with 2 bits per state, 16 states to a uint32
+UNKNOWN, WIN, LOSS, DRAW = 0, 1, 2, 3
+
+
+@njit(cache=True)
+def get_outcome(table, i):
+    """Reads the 2-bit outcome of state i from a packed outcome table"""
+    return (table[i >> 4] >> ((i & 15) * 2)) & 3
+
+
+@njit(cache=True)
+def set_outcome(table, i, outcome):
+    """Writes the 2-bit outcome of state i into a packed outcome table"""
+    shift = (i & 15) * 2
+    table[i >> 4] = (table[i >> 4] & ~np.uint32(3 << shift)) | np.uint32(outcome << shift)
+
+
+@njit(cache=True)
+def outcome_value(lookup, state):
+    """Value of a packed state in a table returned by solve_graph: 1 win, -1 loss, 0 draw"""
+    outcome = get_outcome(lookup, state)
+    if outcome == WIN:
+        return 1
+    if outcome == LOSS:
+        return -1
+    return 0
+
+
+@njit(cache=True)
+def resolve_component(component, outcomes, k, tab_indptr, tab_indices, local_id):
+    """Decides the positions of one strongly connected component, given that every position
+    reachable from it outside of the component is already decided. local_id is scratch space of
+    size k**4 filled with -1, and is left that way.
+
+    The positions that the decided positions outside of the component already settle are the
+    escapes of the component and they are processed first. Their decisions are then propagated to
+    the rest of the component through its internal edges with the same counters as Kahn's
+    algorithm, so every position is queued at most once. The positions left undecided are draws.
+    """
+    m = len(component)
+    for i in range(m):
+        local_id[component[i]] = i
+
+    # First pass over the edges, count the children that are not known to be winning and the
+    # parents inside the component of every position. Escapes are queued as they are found.
+    remaining = np.zeros(m, dtype=np.int32)
+    parent_indptr = np.zeros(m + 1, dtype=np.int32)
+    queue = np.empty(m, dtype=np.int32)
+    tail = 0
+    for i in range(m):
+        position = component[i]
+        won = False
+        for j in range(tab_indptr[position], tab_indptr[position + 1]):
+            child = swap_players(tab_indices[j], k)
+            if local_id[child] != -1:
+                parent_indptr[local_id[child] + 1] += 1
+                remaining[i] += 1
+            else:
+                child_outcome = get_outcome(outcomes, child)
+                won |= child_outcome == LOSS
+                remaining[i] += child_outcome != WIN
+        if won or remaining[i] == 0:
+            set_outcome(outcomes, position, WIN if won else LOSS)
+            queue[tail] = i
+            tail += 1
+
+    # Second pass, fill in the parents inside the component
+    for i in range(m):
+        parent_indptr[i + 1] += parent_indptr[i]
+    fill = parent_indptr[:-1].copy()
+    parent_indices = np.empty(parent_indptr[m], dtype=np.int32)
+    for i in range(m):
+        position = component[i]
+        for j in range(tab_indptr[position], tab_indptr[position + 1]):
+            c = local_id[swap_players(tab_indices[j], k)]
+            if c != -1:
+                parent_indices[fill[c]] = i
+                fill[c] += 1
+
+    # if loss, all parent nodes can force a win.
+    # if win, decrement the remaining counter for all parents
+    head = 0
+    while head < tail:
+        i = queue[head]
+        head += 1
+        lost = get_outcome(outcomes, component[i]) == LOSS
+        for j in range(parent_indptr[i], parent_indptr[i + 1]):
+            p = parent_indices[j]
+            if get_outcome(outcomes, component[p]) != UNKNOWN:
+                continue
+            remaining[p] -= 1
+            if lost or remaining[p] == 0:
+                set_outcome(outcomes, component[p], WIN if lost else LOSS)
+                queue[tail] = p
+                tail += 1
+
+    for position in component:
+        if get_outcome(outcomes, position) == UNKNOWN:
+            set_outcome(outcomes, position, DRAW)
+        local_id[position] = -1
+
+
+@njit(cache=True)
+def solve_states(k):
+    """Solves every state reachable from the initial state in a single iterative DFS. Successors
+    come straight from the successor table, and the strongly connected components are found with
+    Tarjan's algorithm. A component is complete only after everything reachable from it, so it can
+    be resolved as soon as it is popped. Returns the 2-bit outcome table indexed by packed id.
+
+    The value of a state only depends on whose hands are whose, not on which player is which, so
+    the search runs over positions: the packed state of player 1 to move without the turn bit,
+    which is also the successor table key. A position's children are the successor codes with the
+    players swapped, so the mover is first again. Outcomes are already relative to the player to
+    move, so no negation is needed, and the results are copied to both turns at the end.
+    """
+    n_positions = k**4
+    tab_indptr, tab_indices = build_successor_table(k)
+    outcomes = np.zeros((n_positions + 15) // 16, dtype=np.uint32)
+
+    # Tarjan bookkeeping, the DFS keeps the next successor to try for every position on its stack
+    index = np.full(n_positions, -1, dtype=np.int32)
+    lowlink = np.empty(n_positions, dtype=np.int32)
+    on_stack = np.zeros(n_positions, dtype=np.uint8)
+    dfs_positions = np.empty(n_positions, dtype=np.int32)
+    dfs_next = np.empty(n_positions, dtype=np.int32)
+    component_stack = np.empty(n_positions, dtype=np.int32)
+    local_id = np.full(n_positions, -1, dtype=np.int32)
+    dfs_top = 0
+    component_top = 0
+    counter = 0
+
+    position = canon(1, 1, 1, 1, 0, k) >> 1
+    index[position] = lowlink[position] = counter
+    counter += 1
+    on_stack[position] = 1
+    component_stack[component_top] = position
+    component_top += 1
+    dfs_positions[dfs_top] = position
+    dfs_next[dfs_top] = tab_indptr[position]
+    dfs_top += 1
+    while dfs_top > 0:
+        position = dfs_positions[dfs_top - 1]
+        i = dfs_next[dfs_top - 1]
+        if i < tab_indptr[position + 1]:
+            # Try the next successor of the position on top of the DFS stack
+            dfs_next[dfs_top - 1] = i + 1
+            child = swap_players(tab_indices[i], k)
+            if index[child] == -1:
+                index[child] = lowlink[child] = counter
+                counter += 1
+                on_stack[child] = 1
+                component_stack[component_top] = child
+                component_top += 1
+                dfs_positions[dfs_top] = child
+                dfs_next[dfs_top] = tab_indptr[child]
+                dfs_top += 1
+            elif on_stack[child]:
+                lowlink[position] = min(lowlink[position], index[child])
+            continue
 
-        graph[state] = next_states
-        for next_state in next_states:
-            if next_state not in graph:
-                graph[next_state] = []
-                stack.append(next_state)
-    return graph
+        # All successors are done, return to the parent
+        dfs_top -= 1
+        if dfs_top > 0:
+            parent = dfs_positions[dfs_top - 1]
+            lowlink[parent] = min(lowlink[parent], lowlink[position])
+        if lowlink[position] != index[position]:
+            continue
 
+        # The position is the root of a component, pop it and decide its positions
+        start = component_top - 1
+        while component_stack[start] != position:
+            start -= 1
+        on_stack[component_stack[start:component_top]] = 0
+        resolve_component(
+            component_stack[start:component_top], outcomes, k, tab_indptr, tab_indices, local_id
+        )
+        component_top = start
 
-def reverse_graph(g):
-    g_reverse = {state: [] for state in g.keys()}
-    for state, children in g.items():
-        for child in children:
-            g_reverse[child].append(state)
-    return g_reverse
+    # Player 1 to move in (l1, l2, r1, r2) is the same game as player 2 to move in (r1, r2, l1, l2)
+    lookup = np.zeros((2 * n_positions + 15) // 16, dtype=np.uint32)
+    for position in range(n_positions):
+        outcome = get_outcome(outcomes, position)
+        if outcome != UNKNOWN:
+            set_outcome(lookup, position << 1, outcome)
+            set_outcome(lookup, (swap_players(position, k) << 1) | 1, outcome)
+    return lookup
 
 
 def find_path(graph, start, end):
@@ -113,17 +470,23 @@ def find_path(graph, start, end):
 
     if start == end:
         return [start]
-    queue = [(start, [start])]
-    visited = set([start])
+    queue = deque([start])
+    parent = {start: None}
 
     while queue:
-        vertex, path = queue.pop(0)
+        vertex = queue.popleft()
         for neighbor in graph.get(vertex, []):
+            if neighbor in parent:
+                continue
+            parent[neighbor] = vertex
             if neighbor == end:
-                return path + [neighbor]
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
+                # Walk the parent pointers back to start
+                path = []
+                while neighbor is not None:
+                    path.append(neighbor)
+                    neighbor = parent[neighbor]
+                return path[::-1]
+            queue.append(neighbor)
     return None
 
 
@@ -132,59 +495,20 @@ def solve_graph(k=5):
     The state lookup table is expressed in terms of the CURRENT PLAYER'S
     ability to win/lose/draw from this
     position given player 2 makes optimal moves. The state +1 means that the player will win from this state,
-    -1 means thy will lose, and 0 means a draw.
+    -1 means thy will lose, and 0 means a draw. The table packs 2 bits per packed state id, read it
+    with outcome_value.
 
-    The algorithm works with a backwards topological sort, starting from the terminal nodes. The
-    graph is directed with states as nodes and actions as edges.
+    The algorithm works bottom-up on the graph of states, with states as nodes and actions as edges.
 
     We can propagate the win/loss/draw upwards with the following:
     1) if a node has ANY child has any such that the next player is losing, current node is winning
     2) if the node has ALL children such that the next player is winning, the current node is losing
 
-    All other nodes are draws. Simply propagate upward with a topological sort, keeping track of
-    each node's winningness with a dictionary
+    All other nodes are draws. A single DFS enumerates the states and splits them into strongly
+    connected components. Components come out children first, so each one is decided from
+    already decided states outside of it, see solve_states.
     """
-
-    # Generate graph and lookup table for the states. The state for all nodes starts as a draw, but
-    # these states are updated as the algorithm runs.
-    g = generate_graph(k)
-    parents = reverse_graph(g)
-    state_lookup = {state: 0 for state in g.keys()}
-    winning_children = {state: 0 for state in g.keys()}
-
-    # Terminal states
-    terminal_states = []
-    for state, children in g.items():
-        if len(children) == 0:
-            terminal_states.append(state)
-            state_lookup[state] = -1
-
-    # Work backward with a topological sort
-    visited = set()
-    stack = terminal_states.copy()
-    while stack:
-        state = stack.pop()
-        if state in visited:
-            continue
-        visited.add(state)
-
-        # if loss, all parent nodes can force a win.
-        # if win, increment the winning_children counter for all parents
-        if state_lookup[state] == -1:
-            for p in parents[state]:
-                state_lookup[p] = 1
-                if p not in visited:
-                    stack.append(p)
-        elif state_lookup[state] == 1:
-            for p in parents[state]:
-                winning_children[p] += 1
-                if winning_children[p] == len(g[p]):
-                    state_lookup[p] = -1
-                    if p not in visited:
-                        stack.append(p)
-        else:
-            print("Error, we shouldn't be exploring a draw node!")
-    return state_lookup
+    return solve_states(k)
 
 
 def visualize_graph(g, lookup):
@@ -205,7 +529,7 @@ def visualize_graph(g, lookup):
     color_map = {-1: "red", 0: "grey", 1: "green"}
 
     # Get node colors based on their status
-    node_colors = [color_map[lookup[node]] for node in G.nodes()]
+    node_colors = [color_map[outcome_value(lookup, node)] for node in G.nodes()]
 
     # Create a figure
     plt.figure(figsize=(10, 8))
@@ -265,17 +589,17 @@ if __name__ == "__main__":
 
 #         g = generate_graph(k)
 #         lookup = solve_graph(k)
-#         state = (1, 1, 1, 1, 0)
+#         state = canon(1, 1, 1, 1, 0, k)
 
 #         end_time = time.time()
 #         runtime = end_time - start_time
 #         runtimes.append(runtime)
 
-#         if lookup[state] == 0:
+#         if outcome_value(lookup, state) == 0:
 #             result = "draw"
-#         elif lookup[state] == -1:
+#         elif outcome_value(lookup, state) == -1:
 #             result = "player 2"
-#         else:  # lookup[state] == 1
+#         else:  # outcome_value(lookup, state) == 1
 #             result = "player 1"
 
 #         results.append(result)